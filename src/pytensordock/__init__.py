@@ -1,3 +1,4 @@
 __version__ = "0.1.1"
 
-from .api import *
\ No newline at end of file
+from .api import *
+from .async_api import *
\ No newline at end of file
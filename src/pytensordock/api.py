@@ -1,56 +1,389 @@
 import json
+import re
+import threading
+import time
 import requests
-from typing import Optional, Dict, Any
+import urllib3
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Optional, Dict, Any, Callable, Iterable, Iterator, List, Tuple
 
+__all__ = ["TensorDockWrapper"]
 
-class TensorDockWrapper:
-    def __init__(self, api_key: str, api_token: str, debug: bool = False):
+try:
+    import orjson
+
+    _loads = orjson.loads
+    _encode = orjson.dumps
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+except ImportError:
+    orjson = None
+    _loads = json.loads
+
+    def _encode(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+    def _dumps(obj: Any) -> str:
+        return json.dumps(obj, indent=2)
+
+
+def _noop(response: Any) -> None:
+    return None
+
+
+class _ChunkReader:
+    """Minimal file-like view over an iterator of byte chunks, for parsers that expect `read()`."""
+
+    def __init__(self, chunks: Iterator[bytes]):
+        self._chunks = chunks
+
+    def read(self, size: int = -1) -> bytes:
+        # Parsers probe the stream type with read(0), which must not consume a chunk.
+        if size == 0:
+            return b""
+        # An empty read means EOF to the caller, so skip any empty chunks the iterator produces.
+        for chunk in self._chunks:
+            if chunk:
+                return chunk
+        return b""
+
+
+# (keyword argument, query parameter) pairs for the hostnode listing filters.
+_HOSTNODE_PARAM_MAP = (
+    ("min_vcpus", "minvCPUs"),
+    ("min_ram", "minRAM"),
+    ("min_storage", "minStorage"),
+    ("min_vram", "minVRAM"),
+    ("min_gpu_count", "minGPUCount"),
+    ("requires_rtx", "requiresRTX"),
+    ("requires_gtx", "requiresGTX"),
+)
+
+
+# Query strings can carry the API key and token, so they are stripped from URLs in error messages.
+_QUERY_STRING = re.compile(r"\?[^\s'\"]*")
+
+
+def _redact(error: Exception) -> str:
+    """Return the error message with any URL query strings removed."""
+    return _QUERY_STRING.sub("", str(error))
+
+
+# Most responses kept by the response cache before the least recently stored ones are dropped.
+_CACHE_MAX_ENTRIES = 512
+
+# Failures that may succeed on a later attempt: dropped connections, timeouts and these HTTP statuses.
+_TRANSIENT_STATUSES = frozenset((429, 500, 502, 503, 504))
+_TRANSIENT_ERRORS = (
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+    requests.exceptions.ChunkedEncodingError,
+)
+
+
+def _is_transient(error: Exception, transient_errors: Tuple[type, ...]) -> bool:
+    """Whether a request error is a temporary upstream or network failure rather than a client error."""
+    status = getattr(getattr(error, "response", None), "status_code", None)
+    if status is not None:
+        return status in _TRANSIENT_STATUSES
+    return isinstance(error, transient_errors)
+
+
+def _pooled_session(retry: Retry) -> requests.Session:
+    """Create a requests session whose connection pool fits `batch` and which retries with `retry`."""
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retry))
+    return session
+
+
+class _BaseWrapper:
+    """Transport-independent behaviour shared by `TensorDockWrapper` and `AsyncTensorDockWrapper`."""
+
+    # API path of each endpoint, keyed by the method that calls it.
+    _ENDPOINT_PATHS = (
+        ("stop_server", "client/stop/single"),
+        ("start_server", "client/start/single"),
+        ("modify_server", "client/modify/single"),
+        ("delete_server", "client/delete/single"),
+        ("list_virtual_machines", "client/list"),
+        ("get_vm_details", "client/get/single"),
+        ("soft_validate_new_spot_instance", "client/spot/validate/new"),
+        ("soft_validate_existing_spot_instance", "client/spot/validate/new"),
+        ("deploy_machine", "client/deploy/single"),
+        ("list_available_hostnodes", "client/deploy/hostnodes"),
+        ("list_authorizations", "auth/list"),
+        ("retrieve_balance", "billing/balance"),
+        ("test_authorization", "auth/test"),
+        ("get_specific_hostnode", "client/deploy/hostnodes/"),
+    )
+
+    def __init__(self, api_key: str, api_token: str, debug: bool, use_json: bool):
+        self.base_url = "https://marketplace.tensordock.com/api/v0/"
+        self.api_key = api_key
+        self.api_token = api_token
+        self.debug = debug
+        self._auth = {"api_key": api_key, "api_token": api_token}
+        self._use_json = use_json
+        # JSON bodies can carry numbers and lists natively; form bodies need them as strings.
+        self._stringify = (lambda value: value) if use_json else str
+
+    @property
+    def base_url(self) -> str:
+        """Base URL of the TensorDock API; setting it redirects every endpoint."""
+        return self._base_url
+
+    @base_url.setter
+    def base_url(self, value: str) -> None:
+        self._base_url = value
+        # Full URLs are built once here so each call only does a dict lookup.
+        self._endpoints = {name: value + path for name, path in self._ENDPOINT_PATHS}
+
+    @property
+    def debug(self) -> bool:
+        """Whether responses are pretty-printed after each call."""
+        return self._debug
+
+    @debug.setter
+    def debug(self, value: bool) -> None:
+        self._debug = value
+        self._maybe_debug = self._parse_response if value else _noop
+
+    def _format_ports(self, ports: list):
+        """Format a port list for the request body: a JSON array in JSON mode, otherwise the API's "{1, 2, 3}" string form."""
+        if self._use_json:
+            return list(ports)
+        return "{" + ", ".join(map(str, ports)) + "}"
+
+    def _parse_response(self, response: dict) -> Dict[str, Any]:
+        """Parse and pretty-print the JSON response.
+
+        Args:
+            response (dict): The JSON response.
+
+        Returns:
+            dict: The same response, unchanged.
+        """
+        try:
+            print(_dumps(response))
+        except TypeError as e:
+            print(f"Error encoding JSON: {e}")
+        return response
+
+    @staticmethod
+    def _hostnode_params(
+        min_vcpus: Optional[int],
+        min_ram: Optional[int],
+        min_storage: Optional[int],
+        min_vram: Optional[int],
+        min_gpu_count: Optional[int],
+        requires_rtx: Optional[bool],
+        requires_gtx: Optional[bool],
+    ) -> Dict[str, Any]:
+        """Build the query parameters for the hostnode listing endpoints, leaving out unset filters.
+
+        Booleans are sent as "True"/"False" so the query string is the same whichever HTTP client encodes it.
+        """
+        filters = locals()
+        return {
+            name: str(filters[arg]) if isinstance(filters[arg], bool) else filters[arg]
+            for arg, name in _HOSTNODE_PARAM_MAP
+            if filters[arg] is not None
+        }
+
+
+class TensorDockWrapper(_BaseWrapper):
+    def __init__(
+        self,
+        api_key: str,
+        api_token: str,
+        debug: bool = False,
+        cache_ttl: float = 30,
+        use_json: bool = False,
+        http2: bool = False,
+        fallback_max_age: float = 300,
+    ):
         """Initialize the TensorDockAPIWrapper.
 
         Args:
             api_key (str): The API key for authentication.
             api_token (str): The API token for authentication.
+            cache_ttl (float): Number of seconds hostnode listings are cached for. Set to 0 to disable caching. Cached responses are shared between calls, so copy one before modifying it.
+            use_json (bool): Send request bodies as JSON instead of form-encoded fields.
+            http2 (bool): Use an HTTP/2 `httpx` client, which multiplexes concurrent calls over one connection. Requires `httpx[http2]`.
+            fallback_max_age (float): If a read-only call fails with a connection error, timeout, 429 or 5xx, its last successful response is returned instead, marked with `"stale": True`, as long as it is at most this many seconds old. Set to 0 to always return the error.
         """
-        self.base_url = "https://marketplace.tensordock.com/api/v0/"
-        self.api_key = api_key
-        self.api_token = api_token
-        self.debug = debug
+        super().__init__(api_key, api_token, debug, use_json)
+        self.timeout = (3.05, 30)
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._cache_ttl = cache_ttl
+        self._fallback_max_age = fallback_max_age
+
+        self._http2 = http2
+        self._http_errors = (requests.exceptions.RequestException,)
+        self._transient_errors = _TRANSIENT_ERRORS
+        if http2:
+            # Imported here so that only HTTP/2 users pay for loading httpx.
+            try:
+                import httpx
+            except ImportError:
+                raise ImportError("http2=True requires the 'httpx[http2]' package") from None
+            # httpx ignores the client's http2/limits arguments when a transport is given, so they go on the transport.
+            self._session = httpx.Client(
+                timeout=httpx.Timeout(self.timeout[1], connect=self.timeout[0]),
+                transport=httpx.HTTPTransport(http2=True, limits=httpx.Limits(max_connections=20), retries=5),
+            )
+            # The httpx transport only retries failed connections, so every request can share the one client.
+            self._read_session = self._session
+            self._http_errors += (httpx.HTTPError,)
+            self._transient_errors += (httpx.TransportError,)
+        else:
+            retry = Retry(total=5, backoff_factor=0.25, status_forcelist=_TRANSIENT_STATUSES, raise_on_status=False)
+            # Status retries use urllib3's default idempotent methods, so POSTs such as deploys are never replayed.
+            self._session = _pooled_session(retry)
+            # Read-only endpoints are POSTs too, so _cached_request sends them through a session that may retry POSTs.
+            self._read_session = _pooled_session(retry.new(allowed_methods=Retry.DEFAULT_ALLOWED_METHODS | {"POST"}))
+        # Bound once here so _send_request skips the attribute lookups on every call.
+        self._request = self._session.request
+        self._read_request = self._read_session.request
+
+    def close(self) -> None:
+        """Close the underlying HTTP sessions and release pooled connections."""
+        self._session.close()
+        if self._read_session is not self._session:
+            self._read_session.close()
+
+    def __enter__(self) -> "TensorDockWrapper":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def batch(self, fn: Callable[..., Dict[str, Any]], arg_list: Iterable, max_workers: int = 16) -> List[Dict[str, Any]]:
+        """Call a wrapper method concurrently for every item in `arg_list`.
+
+        The calls share the pooled HTTP session, so independent requests (e.g. fetching the details of many VMs) overlap instead of running one after another.
+
+        Example:
+            wrapper.batch(wrapper.get_vm_details, list_of_uuids)
 
-    def _send_request(
-        self, method: str, endpoint: str, payload: Optional[dict] = None, params: Optional[dict] = None
+        Args:
+            fn (Callable): The wrapper method to call, e.g. `wrapper.get_vm_details`.
+            arg_list (Iterable): The arguments for each call. A tuple is unpacked as positional arguments, any other value is passed as the single argument.
+            max_workers (int): Maximum number of calls in flight at once.
+
+        Returns:
+            list: The JSON responses, in the same order as `arg_list`.
+
+        Raises:
+            Exception: If a call raises, the exception of the first such call in `arg_list` order is re-raised once every call has finished.
+        """
+        with ThreadPoolExecutor(max_workers) as executor:
+            futures = [executor.submit(fn, *(args if isinstance(args, tuple) else (args,))) for args in arg_list]
+            return [future.result() for future in futures]
+
+    def invalidate_cache(self) -> None:
+        """Drop all cached responses so the next call goes to the API."""
+        with self._cache_lock:
+            self._cache.clear()
+
+    def _cached_request(
+        self,
+        key: tuple,
+        method: str,
+        url: str,
+        payload: Optional[dict] = None,
+        params: Optional[dict] = None,
+        ttl: Optional[float] = None,
     ) -> Dict[str, Any]:
-        """Send a request to the TensorDock API.
+        """Send a request, reusing a previous successful response for `key` if it is younger than the TTL.
+
+        A cache hit returns the stored response object itself rather than a copy, so it is shared by every caller.
+
+        Only use this for endpoints without side effects. The request goes through the session that also retries POSTs, and if it still fails transiently (connection error, timeout, 429 or 5xx), the last successful response for `key` is returned instead of the error, marked with `"stale": True`, provided it is younger than `fallback_max_age`. Other errors, such as 401 or 404, are returned as-is and evict the cached response.
 
         Args:
+            key (tuple): The cache key identifying the request.
             method (str): The HTTP method (GET, POST, etc.).
-            endpoint (str): The API endpoint.
+            url (str): The full endpoint URL, from `_endpoints`.
             payload (Optional[dict]): The request payload.
             params (Optional[dict]): The request parameters.
+            ttl (Optional[float]): Seconds a cached response is served without a request. Defaults to the wrapper's cache TTL; 0 always sends the request and only keeps the response as a fallback.
 
         Returns:
             dict: The JSON response.
         """
-        url = self.base_url + endpoint
-        response = requests.request(method, url, data=payload, params=params)
+        with self._cache_lock:
+            cached = self._cache.get(key)
+        age = None if cached is None else time.monotonic() - cached[0]
+        if age is not None and age < (self._cache_ttl if ttl is None else ttl):
+            return cached[1]
+        response = self._send_request(method, url, payload, params, read_only=True)
+        if "error" not in response:
+            with self._cache_lock:
+                self._cache[key] = (time.monotonic(), response)
+                self._cache.move_to_end(key)
+                while len(self._cache) > _CACHE_MAX_ENTRIES:
+                    self._cache.popitem(last=False)
+        elif response.get("transient"):
+            if age is not None and age <= self._fallback_max_age:
+                # A shallow copy, so marking it stale leaves the cached response untouched.
+                return {**cached[1], "stale": True}
+        else:
+            # A definitive error (e.g. the VM was deleted) means the old response must not be served later.
+            with self._cache_lock:
+                self._cache.pop(key, None)
+        return response
 
-        try:
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            print(f"Error: {e}")
-            return {"error": str(e)}
+    def _send_request(
+        self,
+        method: str,
+        url: str,
+        payload: Optional[dict] = None,
+        params: Optional[dict] = None,
+        read_only: bool = False,
+    ) -> Dict[str, Any]:
+        """Send a request to the TensorDock API.
 
-    def _parse_response(self, response: dict) -> Dict[str, Any]:
-        """Parse and pretty-print the JSON response.
+        The API key and token are added to the body of POST requests, so callers only pass
+        endpoint-specific fields. GET endpoints that accept credentials add them to `params` themselves.
+        Errors are returned as `{"error": message, "transient": bool}`, where `transient` marks failures
+        worth retrying later.
 
         Args:
-            response (dict): The JSON response.
+            method (str): The HTTP method (GET, POST, etc.).
+            url (str): The full endpoint URL, from `_endpoints`.
+            payload (Optional[dict]): The request payload.
+            params (Optional[dict]): The request parameters.
+            read_only (bool): The request has no side effects, so transient failures may be retried even for POST.
+
+        Returns:
+            dict: The JSON response.
         """
+        if method == "POST":
+            payload = {**self._auth, **(payload or {})}
+        headers = None
+        if self._use_json and payload is not None:
+            payload = _encode(payload)
+            headers = {"Content-Type": "application/json"}
+        request = self._read_request if read_only else self._request
         try:
-            json_formatted_str = json.dumps(response, indent=2)
-            print(json_formatted_str)
-        except json.JSONDecodeError as e:
-            print(f"Error decoding JSON: {e}")
+            if self._http2:
+                body = {"content": payload} if isinstance(payload, bytes) else {"data": payload}
+                response = request(method, url, params=params, headers=headers, **body)
+            else:
+                response = request(method, url, data=payload, params=params, headers=headers, timeout=self.timeout)
+            response.raise_for_status()
+            return _loads(response.content)
+        except self._http_errors + (ValueError,) as e:
+            message = _redact(e)
+            print(f"Error: {message}")
+            return {"error": message, "transient": _is_transient(e, self._transient_errors)}
 
     def stop_server(self, server_uuid: str, disassociate_resources: bool = True) -> Dict[str, Any]:
         """
@@ -63,16 +396,13 @@ class TensorDockWrapper:
         Returns:
             dict: The JSON response.
         """
-        endpoint = "client/stop/single"
+        url = self._endpoints["stop_server"]
         payload = {
-            "api_key": self.api_key,
-            "api_token": self.api_token,
             "server": server_uuid,
             "disassociate_resources": str(disassociate_resources).lower(),
         }
-        response = self._send_request("POST", endpoint, payload)
-        if self.debug:
-            self._parse_response(response)
+        response = self._send_request("POST", url, payload)
+        self._maybe_debug(response)
         return response
 
     def start_server(self, vm_uuid: str) -> Dict[str, Any]:
@@ -85,11 +415,10 @@ class TensorDockWrapper:
         Returns:
             dict: The JSON response.
         """
-        endpoint = "client/start/single"
-        payload = {"api_key": self.api_key, "api_token": self.api_token, "server": vm_uuid}
-        response = self._send_request("POST", endpoint, payload)
-        if self.debug:
-            self._parse_response(response)
+        url = self._endpoints["start_server"]
+        payload = {"server": vm_uuid}
+        response = self._send_request("POST", url, payload)
+        self._maybe_debug(response)
         return response
 
     def modify_server(
@@ -109,20 +438,17 @@ class TensorDockWrapper:
         Returns:
             dict: The JSON response.
         """
-        endpoint = "client/modify/single"
+        url = self._endpoints["modify_server"]
         payload = {
-            "api_key": self.api_key,
-            "api_token": self.api_token,
             "server_id": server_uuid,
             "gpu_model": gpu_model,
-            "gpu_count": str(gpu_count),
-            "ram": str(ram),
-            "vcpus": str(vcpus),
-            "storage": str(storage),
+            "gpu_count": self._stringify(gpu_count),
+            "ram": self._stringify(ram),
+            "vcpus": self._stringify(vcpus),
+            "storage": self._stringify(storage),
         }
-        response = self._send_request("POST", endpoint, payload)
-        if self.debug:
-            self._parse_response(response)
+        response = self._send_request("POST", url, payload)
+        self._maybe_debug(response)
         return response
 
     def delete_server(self, server_uuid: str) -> Dict[str, Any]:
@@ -135,11 +461,10 @@ class TensorDockWrapper:
         Returns:
             dict: The JSON response.
         """
-        endpoint = "client/delete/single"
-        payload = {"api_key": self.api_key, "api_token": self.api_token, "server": server_uuid}
-        response = self._send_request("POST", endpoint, payload)
-        if self.debug:
-            self._parse_response(response)
+        url = self._endpoints["delete_server"]
+        payload = {"server": server_uuid}
+        response = self._send_request("POST", url, payload)
+        self._maybe_debug(response)
         return response
 
     def list_virtual_machines(self) -> Dict[str, Any]:
@@ -149,11 +474,9 @@ class TensorDockWrapper:
         Returns:
             dict: The JSON response.
         """
-        endpoint = "client/list"
-        payload = {"api_key": self.api_key, "api_token": self.api_token}
-        response = self._send_request("POST", endpoint, payload)
-        if self.debug:
-            self._parse_response(response)
+        url = self._endpoints["list_virtual_machines"]
+        response = self._cached_request((url,), "POST", url, ttl=0)
+        self._maybe_debug(response)
         return response
 
     def get_vm_details(self, server_uuid: str) -> Dict[str, Any]:
@@ -166,13 +489,28 @@ class TensorDockWrapper:
         Returns:
             dict: The JSON response.
         """
-        endpoint = "client/get/single"
-        payload = {"api_key": self.api_key, "api_token": self.api_token, "server": server_uuid}
-        response = self._send_request("POST", endpoint, payload)
-        if self.debug:
-            self._parse_response(response)
+        url = self._endpoints["get_vm_details"]
+        payload = {"server": server_uuid}
+        response = self._cached_request((url, server_uuid), "POST", url, payload, ttl=0)
+        self._maybe_debug(response)
         return response
 
+    def all_vm_details(self, max_workers: int = 16) -> Dict[str, Any]:
+        """
+        Retrieve the details of every virtual machine in the organization. The VMs are listed first, then their details are fetched concurrently with `batch`.
+
+        Args:
+            max_workers (int): Maximum number of detail requests in flight at once.
+
+        Returns:
+            dict: The JSON response of `get_vm_details` for each VM, keyed by VM UUID. If listing the VMs fails, the listing's `{"error": ...}` response is returned instead.
+        """
+        listing = self.list_virtual_machines()
+        if "error" in listing:
+            return listing
+        uuids = list(listing.get("virtualmachines", {}))
+        return dict(zip(uuids, self.batch(self.get_vm_details, uuids, max_workers)))
+
     def soft_validate_new_spot_instance(
         self, gpu_count: int, gpu_model: str, vcpus: int, hostnode: str, ram: int, storage: int, price: float
     ) -> Dict[str, Any]:
@@ -193,21 +531,18 @@ class TensorDockWrapper:
         Returns:
             dict: The JSON response.
         """
-        endpoint = "client/spot/validate/new"
+        url = self._endpoints["soft_validate_new_spot_instance"]
         payload = {
-            "gpu_count": str(gpu_count),
+            "gpu_count": self._stringify(gpu_count),
             "gpu_model": gpu_model,
-            "vcpus": str(vcpus),
+            "vcpus": self._stringify(vcpus),
             "hostnode": hostnode,
-            "ram": str(ram),
-            "storage": str(storage),
-            "price": str(price),
-            "api_key": self.api_key,
-            "api_token": self.api_token,
+            "ram": self._stringify(ram),
+            "storage": self._stringify(storage),
+            "price": self._stringify(price),
         }
-        response = self._send_request("POST", endpoint, payload)
-        if self.debug:
-            self._parse_response(response)
+        response = self._send_request("POST", url, payload)
+        self._maybe_debug(response)
         return response
 
     def soft_validate_existing_spot_instance(self, server: str, price: float) -> Dict[str, Any]:
@@ -223,16 +558,13 @@ class TensorDockWrapper:
         Returns:
             dict: The JSON response.
         """
-        endpoint = "client/spot/validate/new"
+        url = self._endpoints["soft_validate_existing_spot_instance"]
         payload = {
             "server": server,
-            "price": str(price),
-            "api_key": self.api_key,
-            "api_token": self.api_token,
+            "price": self._stringify(price),
         }
-        response = self._send_request("POST", endpoint, payload)
-        if self.debug:
-            self._parse_response(response)
+        response = self._send_request("POST", url, payload)
+        self._maybe_debug(response)
         return response
 
     def deploy_machine(
@@ -282,19 +614,17 @@ class TensorDockWrapper:
         Returns:
             dict: The JSON response.
         """
-        endpoint = "client/deploy/single"
+        url = self._endpoints["deploy_machine"]
         payload = {
-            "api_key": self.api_key,
-            "api_token": self.api_token,
             "name": name,
-            "gpu_count": str(gpu_count),
+            "gpu_count": self._stringify(gpu_count),
             "gpu_model": gpu_model,
-            "vcpus": str(vcpus),
-            "ram": str(ram),
-            "external_ports": "{" + ", ".join(map(str, external_ports)) + "}",
-            "internal_ports": "{" + ", ".join(map(str, internal_ports)) + "}",
+            "vcpus": self._stringify(vcpus),
+            "ram": self._stringify(ram),
+            "external_ports": self._format_ports(external_ports),
+            "internal_ports": self._format_ports(internal_ports),
             "hostnode": hostnode,
-            "storage": str(storage),
+            "storage": self._stringify(storage),
             "operating_system": operating_system,
             "password": password,
             "deployment_type": deployment_type,
@@ -302,11 +632,12 @@ class TensorDockWrapper:
             "location": location,
             "cloudinit_script": cloudinit_script,
             "price_type": price_type,
-            "price": str(price),
+            "price": None if price is None else self._stringify(price),
         }
-        response = self._send_request("POST", endpoint, payload)
-        if self.debug:
-            self._parse_response(response)
+        # Optional fields that were not given are left out rather than sent as "None"/null.
+        payload = {key: value for key, value in payload.items() if value is not None}
+        response = self._send_request("POST", url, payload)
+        self._maybe_debug(response)
         return response
 
     def list_available_hostnodes(
@@ -340,30 +671,80 @@ class TensorDockWrapper:
         Returns:
             dict: The JSON response.
         """
-        endpoint = "client/deploy/hostnodes"
+        url = self._endpoints["list_available_hostnodes"]
+        filters = self._hostnode_params(
+            min_vcpus, min_ram, min_storage, min_vram, min_gpu_count, requires_rtx, requires_gtx
+        )
+        key = (url, tuple(filters.items()))
+        params = {**self._auth, **filters}
+        response = self._cached_request(key, "GET", url, params=params)
+        self._maybe_debug(response)
+        return response
+
+    def stream_available_hostnodes(
+        self,
+        filter_fn: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        min_vcpus: Optional[int] = None,
+        min_ram: Optional[int] = None,
+        min_storage: Optional[int] = None,
+        min_vram: Optional[int] = None,
+        min_gpu_count: Optional[int] = None,
+        requires_rtx: Optional[bool] = None,
+        requires_gtx: Optional[bool] = None,
+    ) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Same as `list_available_hostnodes`, but parses the response incrementally and yields one hostnode at a time instead of loading the whole catalog into memory. Requires the optional `ijson` package.
+
+        Args:
+            filter_fn (Callable): Optional predicate called with each hostnode; only hostnodes for which it returns True are yielded.
+            min_vcpus (int): Minimum number of vCPUs.
+            min_ram (int): Minimum amount of RAM.
+            min_storage (int): Minimum SSD storage amount in GB.
+            min_vram (int): Minimum VRAM amount.
+            min_gpu_count (int): Minimum number of GPUs.
+            requires_rtx (bool): Requires RTX GPU.
+            requires_gtx (bool): Requires GTX GPU.
+
+        Yields:
+            tuple: The hostnode ID and its JSON description.
+
+        Raises:
+            Exception: Any HTTP, connection or JSON parsing error, including one part-way through the body, so a truncated catalog is never mistaken for a complete one.
+        """
+        try:
+            import ijson
+        except ImportError:
+            raise ImportError("stream_available_hostnodes requires the 'ijson' package") from None
+        url = self._endpoints["list_available_hostnodes"]
         params = {
-            "api_key": self.api_key,
-            "api_token": self.api_token,
-            "minvCPUs": min_vcpus,
-            "minRAM": min_ram,
-            "minStorage": min_storage,
-            "minVRAM": min_vram,
-            "minGPUCount": min_gpu_count,
-            "requiresRTX": requires_rtx,
-            "requiresGTX": requires_gtx,
+            **self._auth,
+            **self._hostnode_params(min_vcpus, min_ram, min_storage, min_vram, min_gpu_count, requires_rtx, requires_gtx),
         }
-        response = self._parse_response(self._send_request("GET", endpoint, params=params))
-        if self.debug:
-            self._parse_response(response)
-        return response
+        try:
+            if self._http2:
+                stream = self._session.stream("GET", url, params=params)
+            else:
+                stream = self._session.get(url, params=params, timeout=self.timeout, stream=True)
+            with stream as response:
+                response.raise_for_status()
+                if self._http2:
+                    body = _ChunkReader(response.iter_bytes())
+                else:
+                    response.raw.decode_content = True
+                    body = response.raw
+                for hostnode_id, hostnode in ijson.kvitems(body, "hostnodes", use_float=True):
+                    if filter_fn is None or filter_fn(hostnode):
+                        yield hostnode_id, hostnode
+        except self._http_errors + (urllib3.exceptions.HTTPError, ijson.JSONError) as e:
+            # Reading response.raw bypasses requests' exception wrapping, hence the urllib3 errors.
+            print(f"Error: {_redact(e)}")
+            raise
 
     def list_authorizations(self) -> Dict[str, Any]:
         """Get a list of all authorizations."""
-        endpoint = "auth/list"
-        payload = {"api_key": self.api_key, "api_token": self.api_token}
-        response = self._send_request("POST", endpoint, payload)
-        if self.debug:
-            self._parse_response(response)
+        url = self._endpoints["list_authorizations"]
+        response = self._cached_request((url,), "POST", url, ttl=0)
+        self._maybe_debug(response)
         return response
 
     def retrieve_balance(self) -> Dict[str, Any]:
@@ -375,11 +756,9 @@ class TensorDockWrapper:
         Returns:
             dict: The JSON response.
         """
-        endpoint = "billing/balance"
-        payload = {"api_key": self.api_key, "api_token": self.api_token}
-        response = self._send_request("POST", endpoint, payload)
-        if self.debug:
-            self._parse_response(response)
+        url = self._endpoints["retrieve_balance"]
+        response = self._cached_request((url,), "POST", url, ttl=0)
+        self._maybe_debug(response)
         return response
 
     def test_authorization(self) -> Dict[str, Any]:
@@ -393,11 +772,9 @@ class TensorDockWrapper:
         Returns:
             dict: The JSON response.
         """
-        endpoint = "auth/test"
-        payload = {"api_key": self.api_key, "api_token": self.api_token}
-        response = self._send_request("POST", endpoint, payload)
-        if self.debug:
-            self._parse_response(response)
+        url = self._endpoints["test_authorization"]
+        response = self._cached_request((url,), "POST", url, ttl=0)
+        self._maybe_debug(response)
         return response
 
     def get_specific_hostnode(self, id: str) -> Dict[str, Any]:
@@ -409,10 +786,9 @@ class TensorDockWrapper:
         Returns:
             dict: The JSON response.
         """
-        endpoint = f"client/deploy/hostnodes/{id}"
-        response = self._parse_response(self._send_request("GET", endpoint))
-        if self.debug:
-            self._parse_response(response)
+        url = self._endpoints["get_specific_hostnode"] + id
+        response = self._cached_request((url,), "GET", url)
+        self._maybe_debug(response)
         return response
 
 
@@ -0,0 +1,260 @@
+from typing import Optional, Dict, Any
+
+from .api import _BaseWrapper, _TRANSIENT_STATUSES, _encode, _loads, _redact
+
+__all__ = ["AsyncTensorDockWrapper"]
+
+# Set by _import_aiohttp() when the first wrapper is created.
+aiohttp = None
+
+
+def _import_aiohttp() -> None:
+    """Import aiohttp on first use, so importing the package does not pay for it."""
+    global aiohttp
+    if aiohttp is None:
+        try:
+            import aiohttp as module
+        except ImportError:
+            raise ImportError("AsyncTensorDockWrapper requires the 'aiohttp' package") from None
+        aiohttp = module
+
+
+class AsyncTensorDockWrapper(_BaseWrapper):
+    def __init__(self, api_key: str, api_token: str, debug: bool = False, use_json: bool = False):
+        """Initialize the AsyncTensorDockWrapper.
+
+        This is the asyncio counterpart of `TensorDockWrapper`: every API method is a coroutine, and all calls share a single `aiohttp.ClientSession`, so many requests can be in flight on one event loop. Requires the optional `aiohttp` package.
+
+        Example:
+            async with AsyncTensorDockWrapper(api_key, api_token) as wrapper:
+                details = await asyncio.gather(*[wrapper.get_vm_details(uuid) for uuid in uuids])
+
+        Args:
+            api_key (str): The API key for authentication.
+            api_token (str): The API token for authentication.
+            use_json (bool): Send request bodies as JSON instead of form-encoded fields.
+        """
+        _import_aiohttp()
+        super().__init__(api_key, api_token, debug, use_json)
+        self.timeout = aiohttp.ClientTimeout(total=None, sock_connect=3.05, sock_read=30)
+        self._session = None
+
+    def _get_session(self) -> "aiohttp.ClientSession":
+        """Return the shared client session, creating it on first use inside the running event loop."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=100, ttl_dns_cache=300), timeout=self.timeout
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """Close the underlying HTTP session and release pooled connections."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self) -> "AsyncTensorDockWrapper":
+        self._get_session()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def _send_request(
+        self, method: str, url: str, payload: Optional[dict] = None, params: Optional[dict] = None
+    ) -> Dict[str, Any]:
+        """Send a request to the TensorDock API.
+
+        The API key and token are added to the body of POST requests, so callers only pass
+        endpoint-specific fields. GET endpoints that accept credentials add them to `params` themselves.
+        Errors are returned as `{"error": message, "transient": bool}`, like `TensorDockWrapper` does.
+
+        Args:
+            method (str): The HTTP method (GET, POST, etc.).
+            url (str): The full endpoint URL, from `_endpoints`.
+            payload (Optional[dict]): The request payload.
+            params (Optional[dict]): The request parameters.
+
+        Returns:
+            dict: The JSON response.
+        """
+        if method == "POST":
+            payload = {**self._auth, **(payload or {})}
+        # aiohttp rejects None (and bool) query values, so drop unset fields and stringify the rest.
+        if params is not None:
+            params = {k: str(v) for k, v in params.items() if v is not None}
+        if payload is not None:
+            payload = {k: v for k, v in payload.items() if v is not None}
+        headers = None
+        if self._use_json and payload is not None:
+            payload = _encode(payload)
+            headers = {"Content-Type": "application/json"}
+        try:
+            async with self._get_session().request(
+                method, url, data=payload, params=params, headers=headers
+            ) as response:
+                response.raise_for_status()
+                return _loads(await response.read())
+        except (aiohttp.ClientError, ValueError) as e:
+            message = _redact(e)
+            print(f"Error: {message}")
+            if isinstance(e, aiohttp.ClientResponseError):
+                transient = e.status in _TRANSIENT_STATUSES
+            else:
+                transient = isinstance(e, aiohttp.ClientConnectionError)
+            return {"error": message, "transient": transient}
+
+    async def _call(
+        self, method: str, url: str, payload: Optional[dict] = None, params: Optional[dict] = None
+    ) -> Dict[str, Any]:
+        """Send a request and pretty-print the response when debugging is enabled."""
+        response = await self._send_request(method, url, payload, params)
+        self._maybe_debug(response)
+        return response
+
+    async def stop_server(self, server_uuid: str, disassociate_resources: bool = True) -> Dict[str, Any]:
+        """Async version of `TensorDockWrapper.stop_server`."""
+        payload = {
+            "server": server_uuid,
+            "disassociate_resources": str(disassociate_resources).lower(),
+        }
+        return await self._call("POST", self._endpoints["stop_server"], payload)
+
+    async def start_server(self, vm_uuid: str) -> Dict[str, Any]:
+        """Async version of `TensorDockWrapper.start_server`."""
+        return await self._call("POST", self._endpoints["start_server"], {"server": vm_uuid})
+
+    async def modify_server(
+        self, server_uuid: str, gpu_model: str, gpu_count: int, ram: int, vcpus: int, storage: int
+    ) -> Dict[str, Any]:
+        """Async version of `TensorDockWrapper.modify_server`."""
+        payload = {
+            "server_id": server_uuid,
+            "gpu_model": gpu_model,
+            "gpu_count": self._stringify(gpu_count),
+            "ram": self._stringify(ram),
+            "vcpus": self._stringify(vcpus),
+            "storage": self._stringify(storage),
+        }
+        return await self._call("POST", self._endpoints["modify_server"], payload)
+
+    async def delete_server(self, server_uuid: str) -> Dict[str, Any]:
+        """Async version of `TensorDockWrapper.delete_server`."""
+        return await self._call("POST", self._endpoints["delete_server"], {"server": server_uuid})
+
+    async def list_virtual_machines(self) -> Dict[str, Any]:
+        """Async version of `TensorDockWrapper.list_virtual_machines`."""
+        return await self._call("POST", self._endpoints["list_virtual_machines"])
+
+    async def get_vm_details(self, server_uuid: str) -> Dict[str, Any]:
+        """Async version of `TensorDockWrapper.get_vm_details`."""
+        return await self._call("POST", self._endpoints["get_vm_details"], {"server": server_uuid})
+
+    async def all_vm_details(self) -> Dict[str, Any]:
+        """Async version of `TensorDockWrapper.all_vm_details`; the detail requests are issued concurrently with `asyncio.gather`."""
+        # Imported here rather than at module level; aiohttp has already loaded it by the time this runs.
+        import asyncio
+
+        listing = await self.list_virtual_machines()
+        if "error" in listing:
+            return listing
+        uuids = list(listing.get("virtualmachines", {}))
+        return dict(zip(uuids, await asyncio.gather(*[self.get_vm_details(uuid) for uuid in uuids])))
+
+    async def soft_validate_new_spot_instance(
+        self, gpu_count: int, gpu_model: str, vcpus: int, hostnode: str, ram: int, storage: int, price: float
+    ) -> Dict[str, Any]:
+        """Async version of `TensorDockWrapper.soft_validate_new_spot_instance`."""
+        payload = {
+            "gpu_count": self._stringify(gpu_count),
+            "gpu_model": gpu_model,
+            "vcpus": self._stringify(vcpus),
+            "hostnode": hostnode,
+            "ram": self._stringify(ram),
+            "storage": self._stringify(storage),
+            "price": self._stringify(price),
+        }
+        return await self._call("POST", self._endpoints["soft_validate_new_spot_instance"], payload)
+
+    async def soft_validate_existing_spot_instance(self, server: str, price: float) -> Dict[str, Any]:
+        """Async version of `TensorDockWrapper.soft_validate_existing_spot_instance`."""
+        payload = {
+            "server": server,
+            "price": self._stringify(price),
+        }
+        return await self._call("POST", self._endpoints["soft_validate_existing_spot_instance"], payload)
+
+    async def deploy_machine(
+        self,
+        name: str,
+        gpu_count: int,
+        gpu_model: str,
+        vcpus: int,
+        ram: int,
+        external_ports: list,
+        internal_ports: list,
+        hostnode: str,
+        storage: int,
+        operating_system: str,
+        password: str,
+        deployment_type: str = "local",
+        cpu_model: str = None,
+        location: str = None,
+        cloudinit_script: str = None,
+        price_type: str = None,
+        price: float = None,
+    ) -> Dict[str, Any]:
+        """Async version of `TensorDockWrapper.deploy_machine`."""
+        payload = {
+            "name": name,
+            "gpu_count": self._stringify(gpu_count),
+            "gpu_model": gpu_model,
+            "vcpus": self._stringify(vcpus),
+            "ram": self._stringify(ram),
+            "external_ports": self._format_ports(external_ports),
+            "internal_ports": self._format_ports(internal_ports),
+            "hostnode": hostnode,
+            "storage": self._stringify(storage),
+            "operating_system": operating_system,
+            "password": password,
+            "deployment_type": deployment_type,
+            "cpu_model": cpu_model,
+            "location": location,
+            "cloudinit_script": cloudinit_script,
+            "price_type": price_type,
+            "price": None if price is None else self._stringify(price),
+        }
+        return await self._call("POST", self._endpoints["deploy_machine"], payload)
+
+    async def list_available_hostnodes(
+        self,
+        min_vcpus: Optional[int] = None,
+        min_ram: Optional[int] = None,
+        min_storage: Optional[int] = None,
+        min_vram: Optional[int] = None,
+        min_gpu_count: Optional[int] = None,
+        requires_rtx: Optional[bool] = None,
+        requires_gtx: Optional[bool] = None,
+    ) -> Dict[str, Any]:
+        """Async version of `TensorDockWrapper.list_available_hostnodes`."""
+        params = {
+            **self._auth,
+            **self._hostnode_params(min_vcpus, min_ram, min_storage, min_vram, min_gpu_count, requires_rtx, requires_gtx),
+        }
+        return await self._call("GET", self._endpoints["list_available_hostnodes"], params=params)
+
+    async def list_authorizations(self) -> Dict[str, Any]:
+        """Async version of `TensorDockWrapper.list_authorizations`."""
+        return await self._call("POST", self._endpoints["list_authorizations"])
+
+    async def retrieve_balance(self) -> Dict[str, Any]:
+        """Async version of `TensorDockWrapper.retrieve_balance`."""
+        return await self._call("POST", self._endpoints["retrieve_balance"])
+
+    async def test_authorization(self) -> Dict[str, Any]:
+        """Async version of `TensorDockWrapper.test_authorization`."""
+        return await self._call("POST", self._endpoints["test_authorization"])
+
+    async def get_specific_hostnode(self, id: str) -> Dict[str, Any]:
+        """Async version of `TensorDockWrapper.get_specific_hostnode`."""
+        return await self._call("GET", self._endpoints["get_specific_hostnode"] + id)
@@ -0,0 +1,532 @@
+import io
+import json
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+import types
+
+import pytest
+import requests
+import urllib3
+
+from pytensordock import api
+from pytensordock.api import TensorDockWrapper
+
+
+def make_response(status: int = 200, body: dict = None, url: str = "https://marketplace.tensordock.com/api/v0/test"):
+    response = requests.Response()
+    response.status_code = status
+    response._content = json.dumps(body if body is not None else {}).encode()
+    response.url = url
+    return response
+
+
+class StubTransport:
+    """Stands in for `requests.Session.request`, recording calls and replaying queued responses.
+
+    The last queued response is repeated once the others are used up. A queued callable is called with
+    (method, url, kwargs) to build the response, and a queued exception is raised.
+    """
+
+    def __init__(self):
+        self.responses = [make_response()]
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def queue(self, *responses):
+        self.responses = list(responses)
+
+    def __call__(self, method, url, **kwargs):
+        with self._lock:
+            self.calls.append((method, url, kwargs))
+            response = self.responses.pop(0) if len(self.responses) > 1 else self.responses[0]
+        if callable(response):
+            response = response(method, url, kwargs)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+@pytest.fixture
+def transport(monkeypatch):
+    stub = StubTransport()
+    monkeypatch.setattr(requests.Session, "request", stub)
+    return stub
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Freezes the wrapper's clock; advance it by adding seconds to `clock[0]`."""
+    now = [1000.0]
+    monkeypatch.setattr(api, "time", types.SimpleNamespace(monotonic=lambda: now[0]))
+    return now
+
+
+@pytest.fixture
+def wrapper(transport):
+    with TensorDockWrapper("key", "token") as wrapper:
+        yield wrapper
+
+
+def test_credentials_are_added_to_post_bodies(wrapper, transport):
+    wrapper.start_server("vm-1")
+
+    method, _, kwargs = transport.calls[0]
+    assert method == "POST"
+    assert kwargs["data"] == {"api_key": "key", "api_token": "token", "server": "vm-1"}
+    assert not kwargs["params"]
+
+
+def test_hostnode_listing_sends_credentials_in_the_query(wrapper, transport):
+    wrapper.list_available_hostnodes(min_vcpus=2)
+
+    params = transport.calls[0][2]["params"]
+    assert (params["api_key"], params["api_token"], params["minvCPUs"]) == ("key", "token", 2)
+
+
+def test_get_specific_hostnode_sends_no_credentials(wrapper, transport):
+    wrapper.get_specific_hostnode("abc")
+
+    _, url, kwargs = transport.calls[0]
+    assert url.endswith("client/deploy/hostnodes/abc")
+    assert not kwargs["params"] and not kwargs["data"]
+
+
+def test_error_messages_omit_the_query_string(wrapper, transport, capsys):
+    url = "https://marketplace.tensordock.com/api/v0/client/deploy/hostnodes?api_key=key&api_token=token"
+    transport.queue(make_response(404, url=url))
+
+    error = wrapper.list_available_hostnodes()["error"]
+    assert "404 Client Error" in error and "api_token" not in error
+    assert "api_token" not in capsys.readouterr().out
+
+
+def test_batch_returns_results_in_argument_order(wrapper):
+    def slow_echo(value, delay):
+        time.sleep(delay)
+        return value
+
+    # Later arguments finish first, so completion order is the reverse of argument order.
+    assert wrapper.batch(slow_echo, [(1, 0.06), (2, 0.03), (3, 0)]) == [1, 2, 3]
+
+
+def test_batch_unpacks_tuples_and_passes_other_values_through(wrapper, transport):
+    transport.queue(lambda method, url, kwargs: make_response(body={"server": kwargs["data"]["server"]}))
+
+    assert wrapper.batch(wrapper.get_vm_details, ["a", "b"]) == [{"server": "a"}, {"server": "b"}]
+    assert wrapper.batch(lambda a, b: a + b, [(1, 2), (3, 4)]) == [3, 7]
+
+
+def test_batch_propagates_exceptions(wrapper):
+    def check(value):
+        if value == "bad":
+            raise ValueError(value)
+        return value
+
+    with pytest.raises(ValueError, match="bad"):
+        wrapper.batch(check, ["ok", "bad", "ok"])
+
+
+def test_debug_pretty_prints_responses(transport, capsys):
+    transport.queue(make_response(body={"success": True, "server": {"id": "vm-1"}}))
+
+    TensorDockWrapper("key", "token", debug=True).start_server("vm-1")
+
+    out = capsys.readouterr().out
+    assert '\n  "success": true' in out
+    assert json.loads(out) == {"success": True, "server": {"id": "vm-1"}}
+
+
+def test_malformed_body_is_reported_as_an_error(wrapper, transport, capsys):
+    response = make_response()
+    response._content = b"<html>Bad Gateway</html>"
+    transport.queue(response)
+
+    assert "error" in wrapper.start_server("vm-1")
+    assert capsys.readouterr().out.startswith("Error: ")
+
+
+def make_stream_response(body: bytes) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response.raw = urllib3.response.HTTPResponse(body=io.BytesIO(body), preload_content=False)
+    return response
+
+
+@pytest.fixture
+def truncating_server():
+    """A local HTTP server that promises a longer body than it sends, then drops the connection."""
+    listener = socket.socket()
+    listener.bind(("127.0.0.1", 0))
+    listener.listen(1)
+
+    def serve():
+        connection, _ = listener.accept()
+        with connection:
+            connection.recv(65536)
+            body = b'{"hostnodes": {"a": {"cpu": 1}, "b": {"cp'
+            connection.sendall(b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\nContent-Length: 1000\r\n\r\n" + body)
+
+    thread = threading.Thread(target=serve, daemon=True)
+    thread.start()
+    yield "http://127.0.0.1:%d/" % listener.getsockname()[1]
+    thread.join(5)
+    listener.close()
+
+
+def test_stream_yields_filtered_hostnodes(wrapper, transport):
+    pytest.importorskip("ijson")
+    catalog = {"success": True, "hostnodes": {"a": {"cpu": 4}, "b": {"cpu": 16}, "c": {"cpu": 32}}}
+    transport.queue(lambda method, url, kwargs: make_stream_response(json.dumps(catalog).encode()))
+
+    assert list(wrapper.stream_available_hostnodes()) == list(catalog["hostnodes"].items())
+    assert list(wrapper.stream_available_hostnodes(lambda node: node["cpu"] > 8, min_vcpus=8)) == [
+        ("b", {"cpu": 16}),
+        ("c", {"cpu": 32}),
+    ]
+    params = transport.calls[-1][2]["params"]
+    assert (params["api_key"], params["minvCPUs"]) == ("key", 8)
+
+
+def test_stream_raises_on_a_truncated_body(truncating_server, capsys):
+    ijson = pytest.importorskip("ijson")
+    wrapper = TensorDockWrapper("key", "token")
+    wrapper.base_url = truncating_server
+
+    stream = wrapper.stream_available_hostnodes()
+    with pytest.raises((requests.exceptions.RequestException, urllib3.exceptions.HTTPError, ijson.JSONError)):
+        list(stream)
+    assert capsys.readouterr().out.startswith("Error: ")
+
+
+def test_hostnode_listing_is_cached_until_ttl_expires(wrapper, transport, clock):
+    wrapper.list_available_hostnodes(min_vcpus=2)
+    clock[0] += 29
+    wrapper.list_available_hostnodes(min_vcpus=2)
+    assert len(transport.calls) == 1
+
+    clock[0] += 2
+    wrapper.list_available_hostnodes(min_vcpus=2)
+    assert len(transport.calls) == 2
+
+
+def test_cache_is_keyed_by_filters(wrapper, transport, clock):
+    wrapper.list_available_hostnodes(min_vcpus=2)
+    wrapper.list_available_hostnodes(min_vcpus=4)
+    wrapper.get_specific_hostnode("a")
+    wrapper.get_specific_hostnode("b")
+    assert len(transport.calls) == 4
+
+
+def test_invalidate_cache_forces_a_new_request(wrapper, transport, clock):
+    wrapper.get_specific_hostnode("abc")
+    wrapper.invalidate_cache()
+    wrapper.get_specific_hostnode("abc")
+    assert len(transport.calls) == 2
+
+
+def test_errors_are_not_cached(wrapper, transport, clock):
+    transport.queue(make_response(404), make_response(body={"success": True}))
+
+    wrapper.get_specific_hostnode("abc")
+    wrapper.get_specific_hostnode("abc")
+    wrapper.get_specific_hostnode("abc")
+    assert len(transport.calls) == 2
+
+
+def test_cache_size_is_bounded(wrapper, clock, monkeypatch):
+    monkeypatch.setattr(api, "_CACHE_MAX_ENTRIES", 3)
+
+    for hostnode_id in "abcde":
+        wrapper.get_specific_hostnode(hostnode_id)
+    assert [key[0][-1] for key in wrapper._cache] == ["c", "d", "e"]
+
+
+def test_non_idempotent_calls_are_not_cached(wrapper, transport, clock):
+    wrapper.start_server("vm")
+    wrapper.start_server("vm")
+    assert len(transport.calls) == 2
+    assert len(wrapper._cache) == 0
+
+
+def test_importing_the_package_does_not_load_optional_backends():
+    code = "import sys, pytensordock; print(sorted({'aiohttp', 'httpx', 'ijson'} & set(sys.modules)))"
+    src = os.path.dirname(os.path.dirname(api.__file__))
+    out = subprocess.run([sys.executable, "-c", code], cwd=src, capture_output=True, text=True, check=True).stdout
+    assert out.strip() == "[]"
+
+
+def test_json_mode_sends_one_encoded_body(transport):
+    TensorDockWrapper("key", "token", use_json=True).start_server("vm-1")
+
+    kwargs = transport.calls[0][2]
+    assert kwargs["headers"] == {"Content-Type": "application/json"}
+    assert json.loads(kwargs["data"]) == {"api_key": "key", "api_token": "token", "server": "vm-1"}
+
+
+def test_json_mode_leaves_get_requests_without_a_body(transport):
+    TensorDockWrapper("key", "token", use_json=True).get_specific_hostnode("abc")
+
+    kwargs = transport.calls[0][2]
+    assert kwargs["data"] is None and kwargs["headers"] is None
+
+
+DEPLOY_ARGS = dict(
+    name="vm",
+    gpu_count=1,
+    gpu_model="geforcertx3090-pcie-24gb",
+    vcpus=4,
+    ram=16,
+    external_ports=[20022, 28888],
+    internal_ports=[22, 8888],
+    hostnode="node",
+    storage=100,
+    operating_system="Ubuntu 22.04 LTS",
+    password="secret",
+)
+
+
+def test_form_mode_sends_numbers_and_ports_as_strings(wrapper, transport):
+    wrapper.deploy_machine(**DEPLOY_ARGS, price=0.25)
+
+    data = transport.calls[0][2]["data"]
+    assert (data["gpu_count"], data["vcpus"], data["ram"], data["storage"], data["price"]) == ("1", "4", "16", "100", "0.25")
+    assert (data["external_ports"], data["internal_ports"]) == ("{20022, 28888}", "{22, 8888}")
+
+
+def test_json_mode_sends_numbers_and_port_lists_natively(transport):
+    TensorDockWrapper("key", "token", use_json=True).deploy_machine(**DEPLOY_ARGS, price=0.25)
+
+    body = json.loads(transport.calls[0][2]["data"])
+    assert (body["gpu_count"], body["vcpus"], body["ram"], body["storage"], body["price"]) == (1, 4, 16, 100, 0.25)
+    assert (body["external_ports"], body["internal_ports"]) == ([20022, 28888], [22, 8888])
+
+
+@pytest.mark.parametrize("call", [lambda w: w.list_available_hostnodes(), lambda w: w.get_specific_hostnode("abc")])
+def test_hostnode_methods_return_the_response_without_printing(wrapper, transport, capsys, call):
+    transport.queue(make_response(body={"hostnodes": {"a": {}}}))
+
+    assert call(wrapper) == {"hostnodes": {"a": {}}}
+    assert capsys.readouterr().out == ""
+
+
+def test_hostnode_methods_print_once_when_debugging(transport, capsys):
+    TensorDockWrapper("key", "token", debug=True).get_specific_hostnode("abc")
+
+    assert json.loads(capsys.readouterr().out) == {}
+
+
+def test_cache_hits_return_the_stored_response(wrapper, transport, clock):
+    transport.queue(make_response(body={"hostnodes": {"a": {}}}))
+
+    first = wrapper.list_available_hostnodes()
+    assert wrapper.list_available_hostnodes() is first
+
+
+def test_debug_can_be_toggled_after_construction(wrapper, transport, capsys):
+    wrapper.debug = True
+    wrapper.start_server("vm-1")
+    assert json.loads(capsys.readouterr().out) == {}
+
+    wrapper.debug = False
+    wrapper.start_server("vm-1")
+    assert capsys.readouterr().out == ""
+
+
+def test_hostnode_params_skip_unset_filters(wrapper, transport):
+    wrapper.list_available_hostnodes(min_ram=16, requires_gtx=False)
+
+    params = transport.calls[0][2]["params"]
+    assert params == {"api_key": "key", "api_token": "token", "minRAM": 16, "requiresGTX": "False"}
+    assert list(wrapper._cache)[0][1] == (("minRAM", 16), ("requiresGTX", "False"))
+
+
+def test_all_vm_details_fetches_every_listed_vm(wrapper, transport):
+    transport.queue(
+        make_response(body={"success": True, "virtualmachines": {"vm-1": {}, "vm-2": {}}}),
+        lambda method, url, kwargs: make_response(body={"id": kwargs["data"]["server"]}),
+    )
+
+    assert wrapper.all_vm_details() == {"vm-1": {"id": "vm-1"}, "vm-2": {"id": "vm-2"}}
+    assert "server" not in transport.calls[0][2]["data"]
+    assert sorted(call[2]["data"]["server"] for call in transport.calls[1:]) == ["vm-1", "vm-2"]
+
+
+def test_all_vm_details_returns_the_listing_error(wrapper, transport):
+    transport.queue(make_response(401))
+
+    assert "401 Client Error" in wrapper.all_vm_details()["error"]
+    assert len(transport.calls) == 1
+
+
+def test_base_url_redirects_every_endpoint(wrapper, transport):
+    wrapper.base_url = "http://localhost:8000/api/v0/"
+    wrapper.test_authorization()
+    wrapper.get_specific_hostnode("abc")
+
+    assert [call[1] for call in transport.calls] == [
+        "http://localhost:8000/api/v0/auth/test",
+        "http://localhost:8000/api/v0/client/deploy/hostnodes/abc",
+    ]
+
+
+def test_deploy_omits_unset_optional_fields(wrapper, transport):
+    wrapper.deploy_machine(**DEPLOY_ARGS)
+
+    method, url, kwargs = transport.calls[0]
+    assert (method, url) == ("POST", wrapper._endpoints["deploy_machine"])
+    assert kwargs["data"] == {
+        "api_key": "key",
+        "api_token": "token",
+        "name": "vm",
+        "gpu_count": "1",
+        "gpu_model": "geforcertx3090-pcie-24gb",
+        "vcpus": "4",
+        "ram": "16",
+        "external_ports": "{20022, 28888}",
+        "internal_ports": "{22, 8888}",
+        "hostnode": "node",
+        "storage": "100",
+        "operating_system": "Ubuntu 22.04 LTS",
+        "password": "secret",
+        "deployment_type": "local",
+    }
+
+
+def test_json_deploy_omits_unset_optional_fields(transport):
+    TensorDockWrapper("key", "token", use_json=True).deploy_machine(**DEPLOY_ARGS, location="Chicago, Illinois, United States")
+
+    body = json.loads(transport.calls[0][2]["data"])
+    assert body["location"] == "Chicago, Illinois, United States"
+    assert not {"cpu_model", "cloudinit_script", "price_type", "price"} & set(body)
+
+
+@pytest.fixture
+def http2_server(monkeypatch):
+    """Routes the HTTP/2 client through an httpx.MockTransport that records requests and answers with `respond`."""
+    httpx = pytest.importorskip("httpx")
+    pytest.importorskip("h2")
+    server = types.SimpleNamespace(requests=[], respond=lambda request: httpx.Response(200, json={"success": True}))
+
+    def handle(request):
+        request.read()
+        server.requests.append(request)
+        return server.respond(request)
+
+    monkeypatch.setattr(httpx, "HTTPTransport", lambda **kwargs: httpx.MockTransport(handle))
+    return server
+
+
+def test_http2_client_sends_form_and_json_bodies(http2_server):
+    assert TensorDockWrapper("key", "token", http2=True).start_server("vm-1") == {"success": True}
+    TensorDockWrapper("key", "token", http2=True, use_json=True).start_server("vm-1")
+
+    form, body = http2_server.requests
+    assert form.content == b"api_key=key&api_token=token&server=vm-1"
+    assert body.headers["Content-Type"] == "application/json"
+    assert json.loads(body.content) == {"api_key": "key", "api_token": "token", "server": "vm-1"}
+
+
+def test_http2_client_sends_the_same_query_as_requests(http2_server):
+    wrapper = TensorDockWrapper("key", "token", http2=True)
+    wrapper.list_available_hostnodes(min_vcpus=2, requires_rtx=True)
+    wrapper.get_specific_hostnode("abc")
+
+    listing, hostnode = http2_server.requests
+    assert dict(listing.url.params) == {"api_key": "key", "api_token": "token", "minvCPUs": "2", "requiresRTX": "True"}
+    assert hostnode.url.path.endswith("/hostnodes/abc") and not hostnode.url.query
+
+
+def test_http2_client_reports_errors_without_the_query_string(http2_server, capsys):
+    import httpx
+
+    wrapper = TensorDockWrapper("key", "token", http2=True)
+    http2_server.respond = lambda request: httpx.Response(404)
+    error = wrapper.list_available_hostnodes()["error"]
+    assert "404 Not Found" in error and "api_token" not in error
+
+    def refuse(request):
+        raise httpx.ConnectError("connection refused")
+
+    http2_server.respond = refuse
+    assert wrapper.retrieve_balance() == {"error": "connection refused", "transient": True}
+    assert "api_token" not in capsys.readouterr().out
+
+
+def test_http2_stream_reads_the_body_in_chunks(http2_server):
+    import httpx
+
+    pytest.importorskip("ijson")
+    chunks = [b'{"hostnodes": {"a": {"cpu"', b"", b': 4}, "b": {"cpu": 16}}', b"}"]
+    http2_server.respond = lambda request: httpx.Response(200, content=iter(chunks))
+
+    wrapper = TensorDockWrapper("key", "token", http2=True)
+    assert list(wrapper.stream_available_hostnodes()) == [("a", {"cpu": 4}), ("b", {"cpu": 16})]
+
+
+def test_http2_stream_raises_on_a_truncated_body(http2_server):
+    import httpx
+
+    ijson = pytest.importorskip("ijson")
+    http2_server.respond = lambda request: httpx.Response(200, content=iter([b'{"hostnodes": {"a": {"cpu": 4}, "b"']))
+
+    with pytest.raises(ijson.JSONError):
+        list(TensorDockWrapper("key", "token", http2=True).stream_available_hostnodes())
+
+
+def test_http2_connection_limit_is_applied():
+    pytest.importorskip("httpx")
+    pytest.importorskip("h2")
+
+    with TensorDockWrapper("key", "token", http2=True) as wrapper:
+        assert wrapper._session._transport._pool._max_connections == 20
+
+
+@pytest.mark.parametrize("failure", [make_response(503), requests.exceptions.ConnectionError("connection refused")])
+def test_transient_failures_fall_back_to_the_last_good_response(wrapper, transport, clock, failure):
+    transport.queue(make_response(body={"balance": 5}), failure)
+    assert wrapper.retrieve_balance() == {"balance": 5}
+
+    clock[0] += 60
+    assert wrapper.retrieve_balance() == {"balance": 5, "stale": True}
+    assert len(transport.calls) == 2
+    assert wrapper._cache[(wrapper._endpoints["retrieve_balance"],)][1] == {"balance": 5}
+
+
+def test_fallback_is_limited_to_fallback_max_age(transport, clock):
+    wrapper = TensorDockWrapper("key", "token", fallback_max_age=10)
+    transport.queue(make_response(body={"balance": 5}), make_response(503))
+    wrapper.retrieve_balance()
+
+    clock[0] += 11
+    result = wrapper.retrieve_balance()
+    assert "503 Server Error" in result["error"] and result["transient"] is True
+
+
+def test_client_errors_are_returned_and_evict_the_fallback(wrapper, transport, clock):
+    transport.queue(make_response(body={"server": "vm-1"}), make_response(404), make_response(503))
+    wrapper.get_vm_details("vm-1")
+
+    result = wrapper.get_vm_details("vm-1")
+    assert "404 Client Error" in result["error"] and result["transient"] is False
+    assert "stale" not in wrapper.get_vm_details("vm-1")
+
+
+def test_only_read_only_posts_use_the_retrying_session(transport, monkeypatch):
+    sessions = []
+
+    def request(session, method, url, **kwargs):
+        sessions.append(session)
+        return transport(method, url, **kwargs)
+
+    monkeypatch.setattr(requests.Session, "request", request)
+    wrapper = TensorDockWrapper("key", "token")
+    wrapper.retrieve_balance()
+    wrapper.start_server("vm-1")
+
+    assert sessions == [wrapper._read_session, wrapper._session]
+    assert "POST" in wrapper._read_session.get_adapter(wrapper.base_url).max_retries.allowed_methods
+    assert "POST" not in wrapper._session.get_adapter(wrapper.base_url).max_retries.allowed_methods
@@ -0,0 +1,119 @@
+import asyncio
+import json
+from urllib.parse import parse_qsl
+
+import pytest
+
+pytest.importorskip("aiohttp")
+from aiohttp import web  # noqa: E402
+
+from pytensordock.async_api import AsyncTensorDockWrapper  # noqa: E402
+
+
+def ok(request):
+    return web.json_response({"success": True})
+
+
+def run(scenario, respond=ok, **kwargs):
+    """Run `scenario(wrapper)` against a local server answering with `respond(request)`.
+
+    Returns the scenario's result and a list of the requests the server received.
+    """
+    seen = []
+
+    async def handle(request):
+        seen.append(
+            {
+                "method": request.method,
+                "path": request.path,
+                "query": dict(request.query),
+                "content_type": request.content_type,
+                "body": await request.read(),
+            }
+        )
+        response = respond(request)
+        return await response if asyncio.iscoroutine(response) else response
+
+    async def main():
+        app = web.Application()
+        app.router.add_route("*", "/{tail:.*}", handle)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        try:
+            async with AsyncTensorDockWrapper("key", "token", **kwargs) as wrapper:
+                wrapper.base_url = "http://127.0.0.1:%d/" % runner.addresses[0][1]
+                return await scenario(wrapper)
+        finally:
+            await runner.cleanup()
+
+    return asyncio.run(main()), seen
+
+
+def form(body: bytes) -> dict:
+    return dict(parse_qsl(body.decode()))
+
+
+def test_post_sends_credentials_in_the_body():
+    result, seen = run(lambda wrapper: wrapper.start_server("vm-1"))
+
+    assert result == {"success": True}
+    assert seen[0]["method"] == "POST" and seen[0]["path"] == "/client/start/single"
+    assert form(seen[0]["body"]) == {"api_key": "key", "api_token": "token", "server": "vm-1"}
+
+
+def test_hostnode_queries_skip_unset_filters():
+    async def scenario(wrapper):
+        await wrapper.list_available_hostnodes(min_vcpus=2, requires_rtx=True)
+        await wrapper.get_specific_hostnode("abc")
+
+    _, seen = run(scenario)
+
+    assert seen[0]["query"] == {"api_key": "key", "api_token": "token", "minvCPUs": "2", "requiresRTX": "True"}
+    assert seen[1]["path"] == "/client/deploy/hostnodes/abc" and seen[1]["query"] == {}
+
+
+def test_http_errors_are_returned_without_the_query_string(capsys):
+    result, _ = run(lambda wrapper: wrapper.list_available_hostnodes(), respond=lambda request: web.Response(status=404))
+
+    assert "404" in result["error"]
+    assert "api_token" not in result["error"] and "api_token" not in capsys.readouterr().out
+
+
+def test_debug_prints_responses(capsys):
+    run(lambda wrapper: wrapper.test_authorization(), debug=True)
+
+    assert json.loads(capsys.readouterr().out) == {"success": True}
+
+
+def test_json_mode_sends_a_json_body():
+    _, seen = run(lambda wrapper: wrapper.start_server("vm-1"), use_json=True)
+
+    assert seen[0]["content_type"] == "application/json"
+    assert json.loads(seen[0]["body"]) == {"api_key": "key", "api_token": "token", "server": "vm-1"}
+
+
+def test_all_vm_details_fetches_every_listed_vm():
+    async def respond(request):
+        if request.path == "/client/list":
+            return web.json_response({"success": True, "virtualmachines": {"vm-1": {}, "vm-2": {}}})
+        return web.json_response({"id": (await request.post())["server"]})
+
+    result, _ = run(lambda wrapper: wrapper.all_vm_details(), respond=respond)
+
+    assert result == {"vm-1": {"id": "vm-1"}, "vm-2": {"id": "vm-2"}}
+
+
+def test_all_vm_details_returns_the_listing_error():
+    result, seen = run(lambda wrapper: wrapper.all_vm_details(), respond=lambda request: web.Response(status=401))
+
+    assert "401" in result["error"]
+    assert len(seen) == 1
+
+
+@pytest.mark.parametrize("status, transient", [(503, True), (404, False)])
+def test_errors_are_flagged_as_transient_or_not(status, transient):
+    result, _ = run(lambda wrapper: wrapper.retrieve_balance(), respond=lambda request: web.Response(status=status))
+
+    assert result["transient"] is transient